@@ -24,6 +24,14 @@ def _agent_file_path(agent_id: str, config) -> "Path":
     return config.agents_dir / f"{agent_id}.md"
 
 
+def _invalidate_agent_cache() -> None:
+    """Drop agents cached by the external chat manager after an edit."""
+    from ...messaging.manager import get_external_chat_manager
+    messaging = get_external_chat_manager()
+    if messaging is not None:
+        messaging.invalidate_agent_cache()
+
+
 @router.get("/agents")
 async def list_agents(request: Request):
     from ...core.agent import Agent
@@ -71,6 +79,7 @@ color: "{body.color}"
 {body.system_prompt}
 """
     path.write_text(content)
+    _invalidate_agent_cache()
     from ...core.agent import Agent
     agent = Agent.load(agent_id, config)
     return agent.config.model_dump()
@@ -97,6 +106,7 @@ async def update_agent(agent_id: str, body: UpdateAgentBody, request: Request):
         post.content = body.system_prompt
 
     path.write_text(fm.dumps(post))
+    _invalidate_agent_cache()
 
     agent = Agent.load(agent_id, config)
     d = agent.config.model_dump()
@@ -112,4 +122,5 @@ async def delete_agent(agent_id: str, request: Request):
     if not path.exists():
         raise HTTPException(status_code=404, detail=f"User agent not found: {agent_id}")
     path.unlink()
+    _invalidate_agent_cache()
     return {"ok": True}
@@ -132,6 +132,10 @@ class Config:
     def log_keep(self) -> int:
         return int(self.get("logging.keep", 30))
 
+    @property
+    def queue_max(self) -> int:
+        return int(self.get("queue.max_size", 1024))
+
     @property
     def defaults_dir(self) -> "Path | None":
         env = os.getenv("YAPFLOWS_DEFAULTS_DIR")
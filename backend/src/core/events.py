@@ -7,6 +7,9 @@ The same Event types are used everywhere:
 - Consumed in tests
 
 SessionIdEvent is internal only — never forwarded to the frontend.
+
+Event classes are final — never subclassed — so `type(e) is X` is a valid
+(and cheaper) alternative to isinstance when dispatching on them.
 """
 
 from __future__ import annotations
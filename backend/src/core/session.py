@@ -8,6 +8,7 @@ SessionStore: persistence abstraction (swap FileSessionStore ↔ MemorySessionSt
 from __future__ import annotations
 
 import logging
+import os
 import uuid
 from abc import ABC, abstractmethod
 from datetime import datetime
@@ -105,23 +106,38 @@ class MemorySessionStore(SessionStore):
         self.save(state)
 
 
+def _detached(state: "SessionState") -> "SessionState":
+    """Copy of state that callers can mutate (alias, external_chat, append messages)
+    without touching the original. Message objects themselves are shared — persisted
+    messages are never edited in place."""
+    update: dict = {"messages": list(state.messages)}
+    if state.external_chat is not None:
+        update["external_chat"] = state.external_chat.model_copy()
+    return state.model_copy(update=update)
+
+
 class FileSessionStore(SessionStore):
     """File-based store. Reads/writes ~/.yapflows/chats/{id}.json."""
 
     def __init__(self, chats_dir: Path) -> None:
         self._chats_dir = chats_dir
         self._chats_dir.mkdir(parents=True, exist_ok=True)
+        # file name -> ((st_ino, st_mtime_ns, st_size), parsed state). save() replaces the
+        # file, so the inode changes on every write even when mtime granularity is coarse.
+        # Bounded by the files on disk: list() prunes entries whose file is gone.
+        self._list_cache: dict[str, tuple[tuple[int, int, int], "SessionState"]] = {}
 
     def _path(self, session_id: str) -> Path:
         return self._chats_dir / f"{session_id}.json"
 
     def save(self, state: "SessionState") -> None:
-        import json
         path = self._path(state.id)
-        # Atomic write via temp file
+        # Atomic write via temp file; serialize straight to bytes (no str round-trip)
         tmp = path.with_suffix(".tmp")
-        tmp.write_text(state.model_dump_json(indent=2))
+        tmp.write_bytes(state.__pydantic_serializer__.to_json(state, indent=2))
         tmp.replace(path)
+        st = path.stat()
+        self._list_cache[path.name] = ((st.st_ino, st.st_mtime_ns, st.st_size), _detached(state))
 
     def load(self, session_id: str) -> "SessionState":
         from .models import SessionState
@@ -131,13 +147,30 @@ class FileSessionStore(SessionStore):
         return SessionState.model_validate_json(path.read_text())
 
     def list(self) -> "list[SessionState]":
+        """All sessions on disk. Unchanged files are served from a cache of parsed
+        states; each call returns fresh copies, so callers may mutate them freely."""
         from .models import SessionState
         states = []
-        for path in self._chats_dir.glob("*.json"):
-            try:
-                states.append(SessionState.model_validate_json(path.read_text()))
-            except Exception as e:
-                log.warning("Failed to load session %s: %s", path.name, e)
+        seen = set()
+        with os.scandir(self._chats_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".json"):
+                    continue
+                seen.add(entry.name)
+                try:
+                    st = entry.stat()
+                    key = (st.st_ino, st.st_mtime_ns, st.st_size)
+                    cached = self._list_cache.get(entry.name)
+                    if cached is not None and cached[0] == key:
+                        state = cached[1]
+                    else:
+                        state = SessionState.model_validate_json(Path(entry.path).read_text())
+                        self._list_cache[entry.name] = (key, state)
+                    states.append(_detached(state))
+                except Exception as e:
+                    log.warning("Failed to load session %s: %s", entry.name, e)
+        for name in self._list_cache.keys() - seen:
+            del self._list_cache[name]
         return states
 
     def archive(self, session_id: str) -> None:
@@ -152,6 +185,7 @@ class FileSessionStore(SessionStore):
 
     def delete(self, session_id: str) -> None:
         path = self._path(session_id)
+        self._list_cache.pop(path.name, None)
         if path.exists():
             path.unlink()
 
@@ -83,14 +83,22 @@ class Task:
             status="pending",
             scheduled_at=scheduled_at or datetime.utcnow(),
         )
+        try:
+            queue.put_nowait(run)
+        except asyncio.QueueFull:
+            run.status = "failed"
+            run.error = "Task queue is full"
+            run.completed_at = datetime.utcnow()
+            self._save_run(run)
+            log.error("Queue full, dropping  run=%s task=%s", run.id, self.config.name)
+            return run
         self._save_run(run)
-        queue.put_nowait(run)
         log.info("Enqueued  run=%s task=%s", run.id, self.config.name)
         return run
 
     def _save_run(self, run: "TaskRun") -> None:
         path = self._runs_dir / f"{run.id}.json"
-        path.write_text(run.model_dump_json(indent=2))
+        path.write_bytes(run.__pydantic_serializer__.to_json(run, indent=2))
 
     def list_runs(self) -> "list[TaskRun]":
         from .models import TaskRun
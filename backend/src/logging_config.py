@@ -11,7 +11,9 @@ from __future__ import annotations
 
 import logging
 import sys
+import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -19,16 +21,27 @@ if TYPE_CHECKING:
     from .config import Config
 
 
+@lru_cache(maxsize=256)
+def _short_name(name: str) -> str:
+    """Strip the 'yapflows.' prefix from a logger name for brevity."""
+    return name[len("yapflows."):] if name.startswith("yapflows.") else name
+
+
 class YapflowsFormatter(logging.Formatter):
     """Fixed-width format: timestamp  LEVEL  [logger]  message"""
 
     FMT = "%(asctime)s  %(levelname)-6s [%(name)-16s] %(message)s"
     DATE_FMT = "%Y-%m-%d %H:%M:%S"
 
+    def __init__(self) -> None:
+        super().__init__(fmt=self.FMT, datefmt=self.DATE_FMT)
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        # Fixed DATE_FMT, no msecs — skip the generic datefmt/default_msec_format branches
+        return time.strftime(self.DATE_FMT, time.localtime(record.created))
+
     def format(self, record: logging.LogRecord) -> str:
-        # Strip 'yapflows.' prefix from logger name for brevity
-        if record.name.startswith("yapflows."):
-            record.name = record.name[len("yapflows."):]
+        record.name = _short_name(record.name)
         return super().format(record)
 
 
@@ -43,9 +56,14 @@ class ColorFormatter(YapflowsFormatter):
     RESET = "\033[0m"
 
     def format(self, record: logging.LogRecord) -> str:
-        color = self.COLORS.get(record.levelname, "")
-        record.levelname = f"{color}{record.levelname}{self.RESET}"
-        return super().format(record)
+        # Restore levelname afterwards — other handlers format the same record
+        levelname = record.levelname
+        color = self.COLORS.get(levelname, "")
+        record.levelname = f"{color}{levelname}{self.RESET}"
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
 
 
 def configure_logging(config: "Config") -> Path:
@@ -74,10 +92,7 @@ def configure_logging(config: "Config") -> Path:
 
     # File handler — always active
     file_handler = logging.FileHandler(log_file, encoding="utf-8")
-    file_handler.setFormatter(YapflowsFormatter(
-        fmt=YapflowsFormatter.FMT,
-        datefmt=YapflowsFormatter.DATE_FMT,
-    ))
+    file_handler.setFormatter(YapflowsFormatter())
     file_handler.setLevel(level)
 
     handlers: list[logging.Handler] = [file_handler]
@@ -85,10 +100,7 @@ def configure_logging(config: "Config") -> Path:
     # Console handler — dev mode only
     if config.dev_mode:
         console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setFormatter(ColorFormatter(
-            fmt=YapflowsFormatter.FMT,
-            datefmt=YapflowsFormatter.DATE_FMT,
-        ))
+        console_handler.setFormatter(ColorFormatter())
         console_handler.setLevel(level)
         handlers.append(console_handler)
 
@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..config import Config
+    from ..core.agent import Agent
     from ..core.models import SessionState
     from ..core.session import SessionStore
     from .base import MessagingProvider
@@ -33,6 +34,9 @@ class ExternalChatManager:
         self._config = config
         self._store = store
         self._providers: dict[str, "MessagingProvider"] = {}
+        # Avoid re-parsing agent files for every new external chat
+        self._agent_cache: dict[str, "Agent"] = {}
+        self._first_agent_id_cache: str | None = None
 
     def register(self, provider: "MessagingProvider") -> None:
         """Register a messaging provider and inject the inbound callback."""
@@ -47,9 +51,13 @@ class ExternalChatManager:
         for provider in self._providers.values():
             await provider.stop()
 
+    def invalidate_agent_cache(self) -> None:
+        """Drop cached agents. Call after agents are created, edited or deleted."""
+        self._agent_cache.clear()
+        self._first_agent_id_cache = None
+
     async def _on_inbound(self, provider_id: str, chat_id: str, text: str) -> None:
         """Handle an inbound message from an external chat."""
-        from ..core.agent import Agent
         from ..core.models import ExternalChat
         from ..core.session import Session
 
@@ -113,7 +121,7 @@ class ExternalChatManager:
                         log.warning("Could not load environment %r for Telegram chat %s", environment_id, chat_id)
 
                 try:
-                    agent = Agent.load(agent_id, self._config)
+                    agent = self._load_agent(agent_id)
                 except KeyError as exc:
                     log.error("Cannot load agent %r for new session: %s", agent_id, exc)
                     provider_obj = self._providers.get(provider_id)
@@ -242,14 +250,28 @@ class ExternalChatManager:
         """Look up the human-readable chat name from config."""
         return self._get_chat_config(provider_id, chat_id).get("name", "")
 
+    def _load_agent(self, agent_id: str) -> "Agent":
+        """Agent.load() with a per-manager cache. Raises KeyError if not found."""
+        from ..core.agent import Agent
+        agent = self._agent_cache.get(agent_id)
+        if agent is None:
+            agent = Agent.load(agent_id, self._config)
+            self._agent_cache[agent_id] = agent
+        return agent
+
     def _first_agent_id(self) -> str | None:
         """Return the ID of the first available agent, or None."""
         from ..core.agent import Agent
+        if self._first_agent_id_cache is not None:
+            return self._first_agent_id_cache
         try:
             agents = Agent.list(self._config)
-            return agents[0].id if agents else None
         except Exception:
             return None
+        for agent in agents:
+            self._agent_cache.setdefault(agent.id, agent)
+        self._first_agent_id_cache = agents[0].id if agents else None
+        return self._first_agent_id_cache
 
 
 # ── Module-level singleton ─────────────────────────────────────────────────────
@@ -64,13 +64,27 @@ def _chunk_text(text: str, limit: int = _MAX_MESSAGE_LEN) -> list[str]:
     return chunks
 
 
+def _parse_chat_ids(chats_raw: list[dict]) -> list[int]:
+    """Numeric chat ids from the settings; invalid entries are skipped with a warning."""
+    ids = []
+    for c in chats_raw:
+        raw = c.get("chat_id", "")
+        try:
+            ids.append(int(raw))
+        except (TypeError, ValueError):
+            if raw:
+                log.warning("Ignoring invalid Telegram chat_id: %r", raw)
+    return ids
+
+
 class TelegramProvider(MessagingProvider):
     provider_id: ClassVar[str] = "telegram"
 
     def __init__(self, config: "Config") -> None:
         self._bot_token: str = config.get("integrations.telegram.bot_token", "") or ""
         chats_raw: list[dict] = config.get("integrations.telegram.chats", []) or []
-        self._allowed_chat_ids: set[str] = {str(c["chat_id"]) for c in chats_raw}
+        # Native ints — compared against update.message.chat_id without str() per update
+        self._allowed_chat_ids: frozenset[int] = frozenset(_parse_chat_ids(chats_raw))
         self._chat_names: dict[str, str] = {
             str(c["chat_id"]): c.get("name", "") for c in chats_raw
         }
@@ -139,25 +153,25 @@ class TelegramProvider(MessagingProvider):
     async def _handle_update(self, update, context) -> None:
         if update.message is None:
             return
-        chat_id = str(update.message.chat_id)
         text = update.message.text or ""
         if not text:
             return
-        if chat_id not in self._allowed_chat_ids:
-            log.warning("Telegram message from unknown chat_id=%s — dropped", chat_id)
+        cid = update.message.chat_id
+        if cid not in self._allowed_chat_ids:
+            log.warning("Telegram message from unknown chat_id=%s — dropped", cid)
             return
         if self._on_message:
-            await self._on_message(self.provider_id, chat_id, text)
+            await self._on_message(self.provider_id, str(cid), text)
 
     async def _handle_command(self, update, context) -> None:
         """Handle /new and /compact commands from Telegram."""
         if update.message is None:
             return
-        chat_id = str(update.message.chat_id)
-        if chat_id not in self._allowed_chat_ids:
-            log.warning("Telegram command from unknown chat_id=%s — dropped", chat_id)
+        cid = update.message.chat_id
+        if cid not in self._allowed_chat_ids:
+            log.warning("Telegram command from unknown chat_id=%s — dropped", cid)
             return
         # Pass the command text (e.g. "/new") through the normal message pipeline
         command_text = update.message.text or ""
         if self._on_message and command_text:
-            await self._on_message(self.provider_id, chat_id, command_text)
+            await self._on_message(self.provider_id, str(cid), command_text)
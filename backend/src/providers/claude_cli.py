@@ -11,6 +11,9 @@ Multi-turn conversation via --resume:
 
 Interaction (user questions) is handled by the shared <ask>...</ask> meta-language
 in interaction_parser.py — no provider-level interception needed.
+
+stdin is /dev/null by default. Set CLAUDE_CLI_TTY=1 (or subclass with
+needs_tty = True) if the tool chain needs an interactive terminal on stdin.
 """
 
 from __future__ import annotations
@@ -20,8 +23,9 @@ import json
 import logging
 import os
 import pty
+import signal
 import uuid
-from typing import AsyncIterator
+from typing import AsyncIterator, ClassVar
 
 from ..core.provider import BaseProvider
 from ..core.models import Message
@@ -56,6 +60,8 @@ class ClaudeCliProvider(BaseProvider):
     """Runs claude CLI as a subprocess and maps stream-json output to Events."""
 
     provider_id = "claude-cli"
+    # Allocate a PTY for stdin. Off by default — stdin is never written to.
+    needs_tty: ClassVar[bool] = os.getenv("CLAUDE_CLI_TTY", "").lower() in ("1", "true")
 
     def __init__(self, model: str) -> None:
         super().__init__(model=model)
@@ -92,18 +98,24 @@ class ClaudeCliProvider(BaseProvider):
 
         log.info("Run started  model=%s resume=%s", self.model, bool(cli_session_id))
 
-        # PTY for stdin so any terminal-aware tool sees an interactive terminal.
-        stdin_master_fd, stdin_slave_fd = pty.openpty()
+        # PTY for stdin only when a terminal-aware tool needs an interactive terminal.
+        stdin_master_fd: int | None = None
+        if self.needs_tty:
+            stdin_master_fd, stdin = pty.openpty()
+        else:
+            stdin = asyncio.subprocess.DEVNULL
 
         proc = await asyncio.create_subprocess_exec(
             *args,
-            stdin=stdin_slave_fd,
+            stdin=stdin,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
             env=env,
             limit=8 * 1024 * 1024,  # 8 MB — default 64 KB is too small for large JSON events
+            start_new_session=True,  # own process group — killed as a unit if the stream is abandoned
         )
-        os.close(stdin_slave_fd)  # parent closes slave end; subprocess has its own copy
+        if stdin_master_fd is not None:
+            os.close(stdin)  # parent closes slave end; subprocess has its own copy
 
         captured_session_id: str | None = None
         session_id_emitted = False
@@ -114,6 +126,7 @@ class ClaudeCliProvider(BaseProvider):
         async def _gen() -> AsyncIterator[Event]:
             nonlocal captured_session_id, session_id_emitted, current_text_id
 
+            reached_eof = False
             try:
                 async for raw_line in proc.stdout:
                     line = raw_line.decode("utf-8", errors="replace").strip()
@@ -223,18 +236,32 @@ class ClaudeCliProvider(BaseProvider):
                         log.info("Run done  session_id=%s", captured_session_id)
                         yield DoneEvent()
 
+                reached_eof = True
+
             except Exception as e:
                 log.error("Provider error: %s", e, exc_info=True)
                 yield ErrorEvent(message=str(e))
 
             finally:
-                try:
-                    os.close(stdin_master_fd)
-                except OSError:
-                    pass
+                if stdin_master_fd is not None:
+                    try:
+                        os.close(stdin_master_fd)
+                    except OSError:
+                        pass
+                if not reached_eof and proc.returncode is None:
+                    # Cancelled, closed or failed mid-stream — stop the CLI and its children
+                    # (it runs in its own session, so SIGINT to the server never reaches it)
+                    try:
+                        os.killpg(proc.pid, signal.SIGTERM)
+                    except ProcessLookupError:
+                        pass
                 await proc.wait()
                 if proc.returncode and proc.returncode != 0:
-                    stderr_data = await proc.stderr.read()
+                    # Bounded read — a misbehaving CLI must not stall cleanup
+                    try:
+                        stderr_data = await asyncio.wait_for(proc.stderr.read(4096), timeout=0.5)
+                    except asyncio.TimeoutError:
+                        stderr_data = b""
                     stderr_text = stderr_data.decode("utf-8", errors="replace").strip()
                     if stderr_text:
                         log.error("claude CLI stderr: %s", stderr_text[:500])
@@ -8,8 +8,10 @@ Yields TextChunkEvents for text, ToolStartEvent/ToolDoneEvent for tool calls.
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator
 
 from ..core.provider import BaseProvider
 from ..core.models import Message
@@ -17,9 +19,101 @@ from ..core.events import (
     Event, TextChunkEvent, ToolStartEvent, ToolDoneEvent,
     DoneEvent, ErrorEvent,
 )
+from ..tools import get_tools
 
 log = logging.getLogger("yapflows.provider")
 
+try:
+    from strands import Agent as StrandsAgent  # type: ignore[import-untyped]
+    from strands.models.litellm import LiteLLMModel  # type: ignore[import-untyped]
+    _strands_import_error = ""
+except ImportError as e:
+    # strands not installed — reported as an ErrorEvent on run()
+    StrandsAgent = LiteLLMModel = None
+    _strands_import_error = str(e)
+
+# (api_key, model_id) -> LiteLLMModel; providers are built per message, the client is not
+_LLM_CACHE: dict[tuple[str, str], Any] = {}
+
+# Dedicated pool: long Strands runs don't compete with the loop's default executor
+_EXECUTOR = ThreadPoolExecutor(thread_name_prefix="openrouter")
+
+
+def _to_strands_message(msg: Message) -> dict:
+    """One stored turn as a Strands message dict."""
+    return {"role": msg.role, "content": [{"type": "text", "text": msg.content}]}
+
+
+class _SyncToAsyncQueueIterator:
+    """Async iterator fed from a worker thread.
+
+    The producer thread calls schedule()/schedule_text()/close(); none of them
+    wait on the event loop, so tokens propagate as fast as the model produces them.
+    Text chunks arriving within `coalesce_window` seconds are merged into one
+    TextChunkEvent (flushed early at `coalesce_max_chars`, or before any other
+    event so ordering is preserved). A window of 0 merges only same-tick chunks.
+    """
+
+    _SENTINEL = object()
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        coalesce_window: float = 0.005,
+        coalesce_max_chars: int = 256,
+    ) -> None:
+        self._loop = loop
+        self._queue: asyncio.Queue = asyncio.Queue()  # unbounded — put_nowait never raises
+        self._coalesce_window = coalesce_window
+        self._coalesce_max_chars = coalesce_max_chars
+        # Loop-side state — only touched from callbacks running on the loop
+        self._pending_text: list[str] = []
+        self._pending_len = 0
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+    # ── Producer side (worker thread) ─────────────────────────────────────────
+
+    def schedule(self, ev: Event) -> None:
+        self._loop.call_soon_threadsafe(self._put, ev)
+
+    def schedule_text(self, text: str) -> None:
+        self._loop.call_soon_threadsafe(self._add_text, text)
+
+    def close(self) -> None:
+        self._loop.call_soon_threadsafe(self._put, self._SENTINEL)
+
+    # ── Loop side ─────────────────────────────────────────────────────────────
+
+    def _add_text(self, text: str) -> None:
+        self._pending_text.append(text)
+        self._pending_len += len(text)
+        if self._pending_len >= self._coalesce_max_chars:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = self._loop.call_later(self._coalesce_window, self._flush)
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._pending_text:
+            self._queue.put_nowait(TextChunkEvent(content="".join(self._pending_text)))
+            self._pending_text.clear()
+            self._pending_len = 0
+
+    def _put(self, item: object) -> None:
+        self._flush()
+        self._queue.put_nowait(item)
+
+    def __aiter__(self) -> "_SyncToAsyncQueueIterator":
+        return self
+
+    async def __anext__(self) -> Event:
+        item = await self._queue.get()
+        if item is self._SENTINEL:
+            raise StopAsyncIteration
+        return item
+
 
 class OpenRouterProvider(BaseProvider):
     """Strands SDK provider routed through OpenRouter."""
@@ -29,6 +123,18 @@ class OpenRouterProvider(BaseProvider):
     def __init__(self, model: str, api_key: str) -> None:
         super().__init__(model=model)
         self._api_key = api_key
+        self._model_id = model if model.startswith("openrouter/") else f"openrouter/{model}"
+
+    def _get_llm(self) -> Any:
+        """Return the shared LiteLLMModel for this key/model, building it on first use."""
+        key = (self._api_key, self._model_id)
+        llm = _LLM_CACHE.get(key)
+        if llm is None:
+            llm = _LLM_CACHE[key] = LiteLLMModel(
+                client_args={"api_key": self._api_key},
+                model_id=self._model_id,
+            )
+        return llm
 
     async def run(
         self,
@@ -37,136 +143,122 @@ class OpenRouterProvider(BaseProvider):
         message: str,
         cli_session_id: str | None = None,  # ignored
     ) -> AsyncIterator[Event]:
-        import asyncio
+        # Keep the BaseProvider contract (awaitable → async iterator) while the
+        # streaming itself is a plain async generator method — no per-call closure.
+        return self._stream(system_prompt, history, message)
 
-        async def _gen() -> AsyncIterator[Event]:
-            event_queue: asyncio.Queue = asyncio.Queue()
-            loop = asyncio.get_event_loop()
+    async def _stream(
+        self,
+        system_prompt: str,
+        history: list[Message],
+        message: str,
+    ) -> AsyncIterator[Event]:
+        loop = asyncio.get_running_loop()
+        events = _SyncToAsyncQueueIterator(loop)
+
+        def _run_sync():
+            try:
+                if StrandsAgent is None:
+                    raise ImportError(_strands_import_error)
 
-            sentinel = object()
+                if not self._api_key:
+                    raise ValueError(
+                        "OpenRouter API key is not configured. "
+                        "Set it in Settings or via OPENROUTER_API_KEY env var."
+                    )
 
-            def _put(ev: Event) -> None:
-                asyncio.run_coroutine_threadsafe(event_queue.put(ev), loop).result()
+                strands_messages = [_to_strands_message(m) for m in history]
 
-            def _run_sync():
-                try:
-                    from strands import Agent
-                    from strands.models.litellm import LiteLLMModel
+                # Track in-progress tool calls: toolUseId -> {name, input}
+                pending: dict[str, dict] = {}
 
-                    if not self._api_key:
-                        raise ValueError(
-                            "OpenRouter API key is not configured. "
-                            "Set it in Settings or via OPENROUTER_API_KEY env var."
-                        )
+                def _parse_input(inp) -> dict:
+                    """Parse tool input — may arrive as partial/complete JSON string."""
+                    import json as _json
+                    if isinstance(inp, dict):
+                        return inp
+                    if isinstance(inp, str):
+                        try:
+                            parsed = _json.loads(inp)
+                            return parsed if isinstance(parsed, dict) else {}
+                        except Exception:
+                            return {}
+                    return {}
 
-                    model_id = self.model if self.model.startswith("openrouter/") else f"openrouter/{self.model}"
-                    llm = LiteLLMModel(
-                        client_args={"api_key": self._api_key},
-                        model_id=model_id,
-                    )
+                def callback_handler(**kwargs):
+                    # Streaming text chunk
+                    text = kwargs.get("data", "")
+                    if text:
+                        events.schedule_text(text)
 
-                    from ..tools import get_tools
-                    tools = get_tools()
-
-                    strands_messages = []
-                    for msg in history:
-                        content = msg.content
-                        if isinstance(content, str):
-                            content = [{"type": "text", "text": content}]
-                        strands_messages.append({"role": msg.role, "content": content})
-
-                    # Track in-progress tool calls: toolUseId -> {name, input}
-                    pending: dict[str, dict] = {}
-
-                    def _parse_input(inp) -> dict:
-                        """Parse tool input — may arrive as partial/complete JSON string."""
-                        import json as _json
-                        if isinstance(inp, dict):
-                            return inp
-                        if isinstance(inp, str):
-                            try:
-                                parsed = _json.loads(inp)
-                                return parsed if isinstance(parsed, dict) else {}
-                            except Exception:
-                                return {}
-                        return {}
-
-                    def callback_handler(**kwargs):
-                        # Streaming text chunk
-                        text = kwargs.get("data", "")
-                        if text:
-                            _put(TextChunkEvent(content=text))
-
-                        # Tool use starting (streams partial JSON input)
-                        if kwargs.get("type") == "tool_use_stream":
-                            current = kwargs.get("current_tool_use") or {}
-                            tid = current.get("toolUseId", "")
-                            name = current.get("name", "unknown")
-                            inp = _parse_input(current.get("input") or {})
-                            if tid and tid not in pending:
+                    # Tool use starting (streams partial JSON input)
+                    if kwargs.get("type") == "tool_use_stream":
+                        current = kwargs.get("current_tool_use") or {}
+                        tid = current.get("toolUseId", "")
+                        if tid:
+                            entry = pending.get(tid)
+                            if entry is None:
+                                name = current.get("name", "unknown")
+                                inp = _parse_input(current.get("input") or {})
                                 pending[tid] = {"name": name, "input": inp}
-                                _put(ToolStartEvent(
+                                events.schedule(ToolStartEvent(
                                     tool_call_id=tid,
                                     tool=name,
                                     input=inp,
                                 ))
-                            elif tid:
-                                # Update with latest partial input
-                                pending[tid]["input"] = inp
-
-                        # Tool result message — tool execution is done
-                        if "message" in kwargs:
-                            msg_obj = kwargs["message"]
-                            if isinstance(msg_obj, dict):
-                                for block in msg_obj.get("content", []):
-                                    if not isinstance(block, dict):
-                                        continue
-                                    tr = block.get("toolResult")
-                                    if not tr:
-                                        continue
-                                    tid = tr.get("toolUseId", "")
-                                    info = pending.pop(tid, {})
-                                    output_parts = []
-                                    for c in tr.get("content", []):
-                                        if isinstance(c, dict) and "text" in c:
-                                            output_parts.append(c["text"])
-                                    inp = _parse_input(info.get("input", {}))
-                                    _put(ToolDoneEvent(
-                                        tool_call_id=tid,
-                                        tool=info.get("name", "unknown"),
-                                        output="\n".join(output_parts),
-                                        input=inp,
-                                    ))
-
-                    agent = Agent(
-                        model=llm,
-                        system_prompt=system_prompt,
-                        tools=tools,
-                        messages=strands_messages,
-                        callback_handler=callback_handler,
-                    )
+                            else:
+                                # Keep the latest raw partial input; parsed once when the tool is done
+                                entry["input"] = current.get("input") or {}
 
-                    agent(message)
+                    # Tool result message — tool execution is done
+                    if "message" in kwargs:
+                        msg_obj = kwargs["message"]
+                        if isinstance(msg_obj, dict):
+                            for block in msg_obj.get("content", []):
+                                if not isinstance(block, dict):
+                                    continue
+                                tr = block.get("toolResult")
+                                if not tr:
+                                    continue
+                                tid = tr.get("toolUseId", "")
+                                info = pending.pop(tid, {})
+                                output_parts = []
+                                for c in tr.get("content", []):
+                                    if isinstance(c, dict) and "text" in c:
+                                        output_parts.append(c["text"])
+                                inp = _parse_input(info.get("input", {}))
+                                events.schedule(ToolDoneEvent(
+                                    tool_call_id=tid,
+                                    tool=info.get("name", "unknown"),
+                                    output="\n".join(output_parts),
+                                    input=inp,
+                                ))
 
-                except ImportError as e:
-                    log.error("Strands SDK not available: %s", e)
-                    _put(ErrorEvent(message=f"OpenRouter provider requires strands-agents: {e}"))
-                except Exception as e:
-                    log.error("OpenRouter provider error: %s", e, exc_info=True)
-                    _put(ErrorEvent(message=str(e)))
-                finally:
-                    asyncio.run_coroutine_threadsafe(event_queue.put(sentinel), loop).result()
+                # A fresh Agent per run: it accumulates per-conversation state (metrics,
+                # agent state, conversation-manager counters) that must not leak between chats
+                agent = StrandsAgent(
+                    model=self._get_llm(),
+                    system_prompt=system_prompt,
+                    tools=get_tools(),
+                    messages=strands_messages,
+                    callback_handler=callback_handler,
+                )
+                agent(message)
 
-            executor_future = loop.run_in_executor(None, _run_sync)
+            except ImportError as e:
+                log.error("Strands SDK not available: %s", e)
+                events.schedule(ErrorEvent(message=f"OpenRouter provider requires strands-agents: {e}"))
+            except Exception as e:
+                log.error("OpenRouter provider error: %s", e, exc_info=True)
+                events.schedule(ErrorEvent(message=str(e)))
+            finally:
+                events.close()
 
-            while True:
-                item = await event_queue.get()
-                if item is sentinel:
-                    break
-                yield item  # type: ignore[misc]
+        executor_future = loop.run_in_executor(_EXECUTOR, _run_sync)
 
-            await executor_future
-            log.info("Run done  model=%s", self.model)
-            yield DoneEvent()
+        async for item in events:
+            yield item
 
-        return _gen()
+        await executor_future
+        log.info("Run done  model=%s", self.model)
+        yield DoneEvent()
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import sys
 from contextlib import asynccontextmanager
 from pathlib import Path
 
@@ -33,6 +34,10 @@ _browser_service = None
 async def lifespan(app: FastAPI):
     global _config, _store, _scheduler, _queue, _queue_task, _tasks, _vnc_service, _browser_service
 
+    # 0. Eager tasks (3.12+): tasks that finish without suspending skip a scheduler trip
+    if sys.version_info >= (3, 12):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     # 1. Load config  (get_config() keeps the singleton so handlers.py shares the same object)
     from .config import get_config
     import os
@@ -91,7 +96,7 @@ async def lifespan(app: FastAPI):
 
     # 5. Start task queue
     from .service.queue import TaskQueue
-    _queue = TaskQueue()
+    _queue = TaskQueue(maxsize=_config.queue_max)
     _queue_task = asyncio.create_task(
         _queue.worker(_store, _config)
     )
@@ -26,6 +26,8 @@ class BrowserService:
         self.context = None
         self.page = None
         self._playwright_obj = None
+        # Concurrent first-use calls must share one Playwright/Chromium launch
+        self._start_lock = asyncio.Lock()
 
     @classmethod
     async def get_instance(cls) -> BrowserService:
@@ -48,6 +50,12 @@ class BrowserService:
             log.debug("Browser already running")
             return
 
+        async with self._start_lock:
+            if self.is_running():
+                return
+            await self._start()
+
+    async def _start(self) -> None:
         log.info("Starting browser")
 
         try:
@@ -141,6 +149,16 @@ class BrowserService:
 
         log.info("Browser stopped")
 
+    async def _body_text(self, max_chars: int) -> str:
+        """Page body text, truncated to max_chars inside the browser so only that much crosses the wire."""
+        text, total = await self.page.evaluate(
+            "(n) => { const t = document.body ? document.body.innerText : ''; return [t.slice(0, n), t.length]; }",
+            max_chars,
+        )
+        if total > max_chars:
+            text += f"\n...(truncated, {total - max_chars} chars omitted)"
+        return text
+
     async def navigate(self, url: str, max_chars: int = 3000) -> dict:
         """
         Navigate to URL and return page text.
@@ -156,12 +174,9 @@ class BrowserService:
         except Exception:
             pass
 
-        text = await self.page.inner_text("body")
+        text = await self._body_text(max_chars)
         current_url = self.page.url
 
-        if len(text) > max_chars:
-            text = text[:max_chars] + f"\n...(truncated, {len(text) - max_chars} chars omitted)"
-
         return {"url": current_url, "text": text}
 
     async def click(self, selector: str, max_chars: int = 3000) -> dict:
@@ -179,12 +194,9 @@ class BrowserService:
         except Exception:
             pass
 
-        text = await self.page.inner_text("body")
+        text = await self._body_text(max_chars)
         current_url = self.page.url
 
-        if len(text) > max_chars:
-            text = text[:max_chars] + f"\n...(truncated, {len(text) - max_chars} chars omitted)"
-
         return {"url": current_url, "text": text}
 
     async def fill(self, selector: str, value: str, max_chars: int = 3000) -> dict:
@@ -203,9 +215,7 @@ class BrowserService:
         except Exception:
             pass
 
-        text = await self.page.inner_text("body")
-        if len(text) > max_chars:
-            text = text[:max_chars] + f"\n...(truncated, {len(text) - max_chars} chars omitted)"
+        text = await self._body_text(max_chars)
 
         return {"url": self.page.url, "text": text}
 
@@ -235,9 +245,7 @@ class BrowserService:
         except Exception:
             pass
 
-        text = await self.page.inner_text("body")
-        if len(text) > max_chars:
-            text = text[:max_chars] + f"\n...(truncated, {len(text) - max_chars} chars omitted)"
+        text = await self._body_text(max_chars)
 
         return {"url": self.page.url, "text": text}
 
@@ -246,12 +254,7 @@ class BrowserService:
         if not self.is_running():
             raise RuntimeError("Browser not running. Navigate to a page first.")
 
-        text = await self.page.inner_text("body")
-
-        if len(text) > max_chars:
-            text = text[:max_chars] + f"\n...(truncated, {len(text) - max_chars} chars omitted)"
-
-        return text
+        return await self._body_text(max_chars)
 
     async def screenshot(self) -> bytes:
         """Take screenshot and return PNG bytes."""
@@ -25,13 +25,19 @@ log = logging.getLogger("yapflows.queue")
 class TaskQueue:
     """Single-worker task queue."""
 
-    def __init__(self) -> None:
-        self._queue: asyncio.Queue = asyncio.Queue()
+    def __init__(self, maxsize: int = 1024) -> None:
+        # Bounded so a stalled worker can't let scheduler bursts grow memory without limit
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
         self._running = False
+        self._shutdown_sentinel = object()
 
     def enqueue(self, run: "TaskRun") -> None:
-        """Push a run onto the queue."""
-        self._queue.put_nowait(run)
+        """Push a run onto the queue. Drops the run if the queue is full."""
+        try:
+            self._queue.put_nowait(run)
+        except asyncio.QueueFull:
+            log.error("Queue full, dropping  run=%s queue_depth=%d", run.id, self._queue.qsize())
+            return
         log.info("Enqueued  run=%s queue_depth=%d", run.id, self._queue.qsize())
 
     async def worker(
@@ -46,10 +52,10 @@ class TaskQueue:
         self._running = True
         log.info("Queue worker started")
         while self._running:
-            try:
-                run = await asyncio.wait_for(self._queue.get(), timeout=1.0)
-            except asyncio.TimeoutError:
-                continue
+            # Sleeps until a run (or the shutdown sentinel) arrives — no idle wakeups
+            run = await self._queue.get()
+            if run is self._shutdown_sentinel:
+                break
 
             try:
                 task = Task.load(run.task_name, config)
@@ -58,7 +64,10 @@ class TaskQueue:
                 run.status = "failed"
                 run.error = f"Task '{run.task_name}' not found"
                 run.completed_at = datetime.utcnow()
-                (config.runs_dir / f"{run.id}.json").write_text(run.model_dump_json(indent=2))
+                # pydantic-core serializes straight to bytes — no str round-trip
+                (config.runs_dir / f"{run.id}.json").write_bytes(
+                    run.__pydantic_serializer__.to_json(run, indent=2)
+                )
                 self._queue.task_done()
                 continue
 
@@ -72,3 +81,7 @@ class TaskQueue:
 
     def stop(self) -> None:
         self._running = False
+        try:
+            self._queue.put_nowait(self._shutdown_sentinel)
+        except asyncio.QueueFull:
+            pass  # worker is busy; lifespan cancels it
@@ -59,24 +59,46 @@ async def _fire_task(task_name: str, config: "Config", queue: "TaskQueue") -> No
         log.error("Failed to fire task '%s': %s", task_name, e)
 
 
-def _register_task_job(scheduler: Any, task: Any, config: "Config", queue: "TaskQueue") -> bool:
-    """Register a single task cron job. Returns True if registered, False if skipped/failed."""
-    from apscheduler.triggers.cron import CronTrigger
+# cron expression -> CronTrigger. Triggers are stateless, so jobs can share them.
+_CRON_CACHE: dict[str, Any] = {}
+
+
+def _get_trigger(cron_expr: str, parts: list[str]) -> Any:
+    """Return the (memoized) CronTrigger for a 5-field cron expression."""
+    trigger = _CRON_CACHE.get(cron_expr)
+    if trigger is None:
+        from apscheduler.triggers.cron import CronTrigger
+        trigger = _CRON_CACHE[cron_expr] = CronTrigger(
+            minute=parts[0], hour=parts[1], day=parts[2],
+            month=parts[3], day_of_week=parts[4],
+        )
+    return trigger
 
+
+def _task_trigger(task: Any) -> Any | None:
+    """CronTrigger for an enabled task, or None if disabled/invalid."""
     if not task.config.enabled:
-        return False
+        return None
     cron_expr = task.config.cron.strip()
     if not cron_expr:
-        return False
+        return None
     parts = cron_expr.split()
     if len(parts) != 5:
         log.warning("Task '%s' has invalid cron '%s' — skipping", task.name, cron_expr)
+        return None
+    try:
+        return _get_trigger(cron_expr, parts)
+    except Exception as e:
+        log.error("Failed to register task '%s': %s", task.name, e)
+        return None
+
+
+def _register_task_job(scheduler: Any, task: Any, config: "Config", queue: "TaskQueue") -> bool:
+    """Register a single task cron job. Returns True if registered, False if skipped/failed."""
+    trigger = _task_trigger(task)
+    if trigger is None:
         return False
     try:
-        trigger = CronTrigger(
-            minute=parts[0], hour=parts[1], day=parts[2],
-            month=parts[3], day_of_week=parts[4],
-        )
         scheduler.add_job(
             _fire_task,
             trigger=trigger,
@@ -85,7 +107,7 @@ def _register_task_job(scheduler: Any, task: Any, config: "Config", queue: "Task
             name=task.name,
             replace_existing=True,
         )
-        log.info("Registered task '%s' cron='%s'", task.name, cron_expr)
+        log.info("Registered task '%s' cron='%s'", task.name, task.config.cron.strip())
         return True
     except Exception as e:
         log.error("Failed to register task '%s': %s", task.name, e)
@@ -113,17 +135,32 @@ def stop_scheduler(scheduler: Any) -> None:
 
 
 def reload_jobs(scheduler: Any, config: "Config", queue: "TaskQueue") -> None:
-    """Reload all cron jobs (called after task create/update/delete)."""
+    """Sync cron jobs with tasks on disk (called after task create/update/delete).
+
+    Only new, changed and removed tasks touch the scheduler; unchanged jobs keep
+    their cached trigger and are left alone.
+    """
     if scheduler is None:
         return
     try:
         from ..core.task import Task
 
-        scheduler.remove_all_jobs()
-        tasks = Task.list(config)
-        for task in tasks:
+        jobs = {job.id: job for job in scheduler.get_jobs()}
+        keep: set[str] = set()
+        for task in Task.list(config):
+            trigger = _task_trigger(task)
+            if trigger is None:
+                continue
+            keep.add(task.name)
+            job = jobs.get(task.name)
+            if job is not None and job.trigger is trigger:
+                continue
             _register_task_job(scheduler, task, config, queue)
 
+        for job_id in jobs.keys() - keep:
+            scheduler.remove_job(job_id)
+            log.info("Removed task job '%s'", job_id)
+
         log.info("Jobs reloaded")
     except Exception as e:
         log.error("Failed to reload jobs: %s", e)
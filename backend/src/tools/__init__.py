@@ -8,11 +8,13 @@ These are NOT used by claude-cli (which handles tools internally).
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 
+@lru_cache(maxsize=1)
 def get_tools() -> list[Any]:
-    """Return all registered Strands tools for the openrouter provider."""
+    """Return all registered Strands tools for the openrouter provider (built once)."""
     from .bash import bash_tool
     from .chat import chat_read, chat_send
     return [bash_tool, chat_read, chat_send]
@@ -7,54 +7,147 @@ subprocess implementation if the built-in is unavailable.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import re
+import shlex
 import subprocess
 
 log = logging.getLogger("yapflows.tool")
 
+# Anything a plain argv can't express — these commands need a real shell
+_SHELL_META = re.compile(r"[|&;<>$`*?()\[\]{}\"'~\\#\n]")
+
+
+def _argv(command: str) -> list[str] | None:
+    """Split a simple `exe args...` command into argv, or None if it needs a shell."""
+    if _SHELL_META.search(command):
+        return None
+    args = shlex.split(command)
+    if not args or "=" in args[0]:  # VAR=value prefixes need the shell
+        return None
+    if args[0] in _SHELL_BUILTINS:
+        return None
+    return args
+
+
+# Names the shell resolves itself — several also exist as binaries (/bin/echo, /bin/kill)
+# that behave differently (`echo -e`), so these always go through the shell
+_SHELL_BUILTINS = frozenset({
+    ".", ":", "[", "alias", "bg", "break", "cd", "command", "continue", "echo", "eval",
+    "exec", "exit", "export", "false", "fc", "fg", "getopts", "hash", "jobs", "kill",
+    "printf", "pwd", "read", "readonly", "return", "set", "shift", "source", "test",
+    "times", "trap", "true", "type", "ulimit", "umask", "unalias", "unset", "wait",
+})
+
+# argv exec failed (not on PATH, not executable, script without a shebang, ...) —
+# let the shell decide, as it would have without the fast path
+_NEEDS_SHELL = OSError
+
+_TIMEOUT = 30
+
+_BASH_TOOL_DOC = """
+Execute a bash shell command and return its output.
+
+Use this to read/write files, run scripts, search content,
+manage memory/knowledge files, and invoke skill scripts.
+
+Args:
+    command: The bash command to execute
+
+Returns:
+    stdout + stderr output of the command
+"""
+
+
+def _run(command: str) -> subprocess.CompletedProcess:
+    """Run command with a 30s timeout (raw bytes output), skipping the shell for simple commands."""
+    args = _argv(command)
+    if args is not None:
+        try:
+            return subprocess.run(args, capture_output=True, timeout=_TIMEOUT)
+        except _NEEDS_SHELL:
+            pass
+    return subprocess.run(command, shell=True, capture_output=True, timeout=_TIMEOUT)
+
+
+async def _spawn(command: str) -> asyncio.subprocess.Process:
+    """Async counterpart of _run: start command with piped stdout/stderr."""
+    pipe = asyncio.subprocess.PIPE
+    args = _argv(command)
+    if args is not None:
+        try:
+            return await asyncio.create_subprocess_exec(*args, stdout=pipe, stderr=pipe)
+        except _NEEDS_SHELL:
+            pass
+    return await asyncio.create_subprocess_shell(command, stdout=pipe, stderr=pipe)
+
+
+def _format_output(stdout: bytes, stderr: bytes, returncode: int) -> str:
+    """Join the raw output streams and decode once."""
+    buf = stdout + b"\n" + stderr if stderr else stdout
+    log.info("Tool done  tool=bash exit=%d output_len=%d", returncode, len(buf))
+    return buf.decode("utf-8", "replace").strip() or "(no output)"
+
+
+def _timed_out(command: str) -> str:
+    log.warning("Tool timeout  tool=bash command=%s", command[:100])
+    return f"Error: command timed out after {_TIMEOUT} seconds"
+
+
+def _failed(e: Exception) -> str:
+    log.error("Tool error  tool=bash error=%s", e)
+    return f"Error: {e}"
+
+
 try:
     from strands.tools import bash as bash_tool  # type: ignore[attr-defined]
 except (ImportError, AttributeError):
     try:
         from strands import tool
 
-        @tool
-        def bash_tool(command: str) -> str:
-            """
-            Execute a bash shell command and return its output.
-
-            Use this to read/write files, run scripts, search content,
-            manage memory/knowledge files, and invoke skill scripts.
-
-            Args:
-                command: The bash command to execute
-
-            Returns:
-                stdout + stderr output of the command
-            """
-            log.info("Tool called  tool=bash command=%s", command[:100])
-            try:
-                result = subprocess.run(
-                    command,
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
-                )
-                output = result.stdout
-                if result.stderr:
-                    output += "\n" + result.stderr
-                log.info("Tool done  tool=bash exit=%d output_len=%d", result.returncode, len(output))
-                return output.strip() or "(no output)"
-            except subprocess.TimeoutExpired:
-                log.warning("Tool timeout  tool=bash command=%s", command[:100])
-                return "Error: command timed out after 30 seconds"
-            except Exception as e:
-                log.error("Tool error  tool=bash error=%s", e)
-                return f"Error: {e}"
+        try:
+            # Strands versions with async tool streaming await coroutine tools on their loop
+            from strands.tools.decorator import DecoratedFunctionTool
+            _ASYNC_TOOLS = hasattr(DecoratedFunctionTool, "stream")
+        except ImportError:
+            _ASYNC_TOOLS = False
 
     except ImportError:
         # strands not installed — create a dummy for import purposes
         def bash_tool(command: str) -> str:  # type: ignore[misc]
             """Bash tool (strands not available)."""
             return "Error: strands-agents not installed"
+
+    else:
+        if _ASYNC_TOOLS:
+
+            async def bash_tool(command: str) -> str:
+                log.info("Tool called  tool=bash command=%s", command[:100])
+                try:
+                    proc = await _spawn(command)
+                    try:
+                        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=_TIMEOUT)
+                    except asyncio.TimeoutError:
+                        proc.kill()
+                        await proc.wait()
+                        return _timed_out(command)
+                    return _format_output(stdout, stderr, proc.returncode)
+                except Exception as e:
+                    return _failed(e)
+
+        else:
+
+            def bash_tool(command: str) -> str:
+                log.info("Tool called  tool=bash command=%s", command[:100])
+                try:
+                    result = _run(command)
+                    return _format_output(result.stdout, result.stderr, result.returncode)
+                except subprocess.TimeoutExpired:
+                    return _timed_out(command)
+                except Exception as e:
+                    return _failed(e)
+
+        # One docstring for both variants — @tool reads it for the tool spec
+        bash_tool.__doc__ = _BASH_TOOL_DOC
+        bash_tool = tool(bash_tool)
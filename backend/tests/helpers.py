@@ -0,0 +1,8 @@
+"""
+Shared constants for Yapflows v2 tests.
+"""
+
+from datetime import datetime
+
+# Fixed timestamp — no test depends on wall-clock time, and a constant keeps runs deterministic
+NOW = datetime(2024, 1, 1, 12, 0, 0)
@@ -3,74 +3,69 @@
 import pytest
 from pathlib import Path
 
+from src.config import Config
+from src.core.agent import Agent
+from src.core.models import AgentConfig
 
-def make_agent_md(directory: Path, name: str, provider: str = "claude-cli", model: str = "claude-opus-4-5", body: str = "You are helpful.") -> Path:
-    """Create a test agent .md file."""
-    content = f"""---
-name: {name}
-provider: {provider}
-model: {model}
----
-
-{body}
-"""
-    directory.mkdir(parents=True, exist_ok=True)
-    path = directory / f"{name.lower().replace(' ', '-')}.md"
-    path.write_text(content)
+_AGENT_TEMPLATE = b"---\nname: %b\nprovider: %b\nmodel: %b\n---\n\n%b\n"
+
+
+def make_agent_md(agents_dir: Path, name: str, provider: str = "claude-cli", model: str = "claude-opus-4-5", body: str = "You are helpful.") -> Path:
+    """Create a test agent .md file in an existing agents dir."""
+    path = agents_dir / f"{name.lower().replace(' ', '-')}.md"
+    path.write_bytes(_AGENT_TEMPLATE % (name.encode(), provider.encode(), model.encode(), body.encode()))
     return path
 
 
-def test_agent_load_builtin(tmp_path):
+@pytest.fixture(scope="module")
+def config(tmp_path_factory):
+    """Read-only Config shared by the module — tests that write files use fresh_config."""
+    return Config(base_dir=tmp_path_factory.mktemp("cfg"))
+
+
+@pytest.fixture
+def fresh_config(tmp_path):
+    return Config(base_dir=tmp_path)
+
+
+@pytest.fixture
+def agents_dir(fresh_config):
+    # Config() already creates agents_dir — no per-file mkdir needed
+    return fresh_config.agents_dir
+
+
+def test_agent_load_builtin(config):
     """Agent.load() finds the built-in assistant agent."""
-    from src.config import Config
-    config = Config(base_dir=tmp_path)
-    
-    from src.core.agent import Agent
     agent = Agent.load("assistant", config)
     assert agent.id == "assistant"
     assert agent.config.builtin is True
 
 
-def test_agent_load_user_override(tmp_path):
+def test_agent_load_user_override(fresh_config, agents_dir):
     """User agent overrides built-in with same name."""
-    from src.config import Config
-    config = Config(base_dir=tmp_path)
-    
     # Create user agent with same name as built-in
-    make_agent_md(config.agents_dir, "assistant", body="Custom prompt")
-    
-    from src.core.agent import Agent
-    agent = Agent.load("assistant", config)
+    make_agent_md(agents_dir, "assistant", body="Custom prompt")
+
+    agent = Agent.load("assistant", fresh_config)
     assert "Custom prompt" in agent.config.system_prompt
     assert agent.config.builtin is False
 
 
-def test_agent_load_not_found(tmp_path):
+def test_agent_load_not_found(config):
     """Agent.load() raises KeyError for unknown agent."""
-    from src.config import Config
-    config = Config(base_dir=tmp_path)
-    
-    from src.core.agent import Agent
     with pytest.raises(KeyError):
         Agent.load("nonexistent-agent-xyz", config)
 
 
-def test_agent_list_includes_builtin(tmp_path):
+def test_agent_list_includes_builtin(config):
     """Agent.list() returns at least the built-in assistant."""
-    from src.config import Config
-    config = Config(base_dir=tmp_path)
-    
-    from src.core.agent import Agent
     agents = Agent.list(config)
     ids = [a.id for a in agents]
     assert "assistant" in ids
 
 
-def test_agent_build_system_prompt_no_memory(tmp_path):
+def test_agent_build_system_prompt_no_memory(config):
     """build_system_prompt() works even without default.md."""
-    from src.config import Config
-    from src.core.agent import Agent
-    from src.core.models import AgentConfig
     config_obj = AgentConfig(
         id="test",
         name="Test",
@@ -78,18 +73,14 @@ def test_agent_build_system_prompt_no_memory(tmp_path):
         model="mock",
         system_prompt="You are a test agent.",
     )
-    cfg = Config(base_dir=tmp_path)
 
-    agent = Agent(config=config_obj, cfg=cfg)
+    agent = Agent(config=config_obj, cfg=config)
     prompt = agent.build_system_prompt()
     assert "You are a test agent." in prompt
 
 
-def test_agent_build_system_prompt_with_memory(tmp_path):
+def test_agent_build_system_prompt_with_memory(fresh_config):
     """build_system_prompt() includes default.md content."""
-    from src.config import Config
-    from src.core.agent import Agent
-    from src.core.models import AgentConfig
     config_obj = AgentConfig(
         id="test",
         name="Test",
@@ -97,10 +88,9 @@ def test_agent_build_system_prompt_with_memory(tmp_path):
         model="mock",
         system_prompt="You are a test agent.",
     )
-    cfg = Config(base_dir=tmp_path)
-    (cfg.memory_dir / "default.md").write_text("User prefers dark mode.\nWorks at Acme.")
+    (fresh_config.memory_dir / "default.md").write_text("User prefers dark mode.\nWorks at Acme.")
 
-    agent = Agent(config=config_obj, cfg=cfg)
+    agent = Agent(config=config_obj, cfg=fresh_config)
     prompt = agent.build_system_prompt()
     assert "You are a test agent." in prompt
     assert "User prefers dark mode." in prompt
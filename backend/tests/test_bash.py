@@ -0,0 +1,38 @@
+"""Tests for the bash tool's command runners."""
+
+import os
+import subprocess
+import pytest
+
+from src.tools.bash import _argv, _run, _spawn
+
+
+@pytest.fixture
+def noshebang_script(tmp_path):
+    path = tmp_path / "noshebang.sh"
+    path.write_text("echo from-script\n")
+    os.chmod(path, 0o755)
+    return str(path)
+
+
+def test_simple_command_skips_shell():
+    assert _argv("ls -la /tmp") == ["ls", "-la", "/tmp"]
+    assert _argv("ls | wc -l") is None
+
+
+def test_builtins_use_shell():
+    assert _argv("echo -e x") is None
+    # Same output as the shell's builtin echo, not /bin/echo
+    assert _run("echo -e x").stdout == subprocess.run(["sh", "-c", "echo -e x"], capture_output=True).stdout
+
+
+def test_script_without_shebang_runs_under_shell(noshebang_script):
+    result = _run(noshebang_script)
+    assert result.stdout == b"from-script\n"
+
+
+@pytest.mark.asyncio
+async def test_spawn_script_without_shebang_runs_under_shell(noshebang_script):
+    proc = await _spawn(noshebang_script)
+    stdout, _ = await proc.communicate()
+    assert stdout == b"from-script\n"
@@ -1,13 +1,18 @@
 """Tests for core data models."""
 
-from datetime import datetime
 import pytest
+from pydantic import TypeAdapter
 from src.core.models import (
     AgentConfig, Message, SessionState, ToolCall,
     ToolCallView, MessageView, SessionView,
     TaskConfig, TaskRun, TriggerConfig, SkillConfig,
     SetupStatus, ProviderTestResult,
 )
+from tests.helpers import NOW
+
+
+# Built once; reuse for any SessionState JSON (de)serialization in this module
+_SS_ADAPTER = TypeAdapter(SessionState)
 
 
 def make_agent_config(**kwargs) -> AgentConfig:
@@ -19,22 +24,22 @@ def make_agent_config(**kwargs) -> AgentConfig:
         system_prompt="You are helpful.",
     )
     defaults.update(kwargs)
-    return AgentConfig(**defaults)
+    # Known-valid test data — skip validation; the roundtrip test below covers the validated path
+    return AgentConfig.model_construct(**defaults)
 
 
 def make_session_state(**kwargs) -> SessionState:
-    now = datetime.utcnow()
     defaults = dict(
         id="sess-test",
         title="Test session",
         agent_id="assistant",
         provider_id="claude-cli",
         model="claude-opus-4-5",
-        created_at=now,
-        updated_at=now,
+        created_at=NOW,
+        updated_at=NOW,
     )
     defaults.update(kwargs)
-    return SessionState(**defaults)
+    return SessionState.model_construct(**defaults)
 
 
 def test_agent_config_defaults():
@@ -65,12 +70,11 @@ def test_session_view_from_state_empty():
 
 
 def test_session_view_from_state_with_messages():
-    now = datetime.utcnow()
     agent_config = make_agent_config()
     state = make_session_state()
     state.messages = [
-        Message(role="user", content="Hello", timestamp=now),
-        Message(role="assistant", content="Hi there!", timestamp=now),
+        Message(role="user", content="Hello", timestamp=NOW),
+        Message(role="assistant", content="Hi there!", timestamp=NOW),
     ]
     view = SessionView.from_state(state, agent_config)
     assert len(view.messages) == 2
@@ -79,7 +83,6 @@ def test_session_view_from_state_with_messages():
 
 
 def test_session_view_tool_call_formatting():
-    now = datetime.utcnow()
     agent_config = make_agent_config()
     state = make_session_state()
     tc = ToolCall(
@@ -87,12 +90,12 @@ def test_session_view_tool_call_formatting():
         tool="bash",
         input={"command": "ls ~/.yapflows/"},
         output="memory/\nchats/\n",
-        started_at=now,
-        completed_at=now,
+        started_at=NOW,
+        completed_at=NOW,
     )
     state.messages = [
-        Message(role="user", content="List files", timestamp=now),
-        Message(role="assistant", content="Here they are:", tool_calls=[tc], timestamp=now),
+        Message(role="user", content="List files", timestamp=NOW),
+        Message(role="assistant", content="Here they are:", tool_calls=[tc], timestamp=NOW),
     ]
     view = SessionView.from_state(state, agent_config)
     msg_view = view.messages[1]
@@ -128,8 +131,21 @@ def test_provider_test_result():
 
 
 def test_session_state_roundtrip_json():
-    state = make_session_state()
-    json_str = state.model_dump_json()
-    state2 = SessionState.model_validate_json(json_str)
+    # Built through the real constructor so validation is exercised at least once
+    state = SessionState(
+        id="sess-test",
+        title="Test session",
+        agent_id="assistant",
+        provider_id="claude-cli",
+        model="claude-opus-4-5",
+        created_at=NOW,
+        updated_at=NOW,
+    )
+    raw = _SS_ADAPTER.dump_json(state)
+    # Parse straight from the JSON bytes (single pass in pydantic-core), not via
+    # model_validate(json.loads(...)), which builds an intermediate dict first.
+    state2 = _SS_ADAPTER.validate_json(raw)
     assert state2.id == state.id
     assert state2.title == state.title
+    assert state2 == state
+    assert SessionState.model_validate_json(raw) == state
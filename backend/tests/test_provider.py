@@ -1,31 +1,64 @@
-"""Tests for MockProvider."""
+"""Tests for MockProvider and provider streaming helpers."""
 
+import asyncio
 import pytest
 from src.core.provider import MockProvider
 from src.core.events import TextChunkEvent, DoneEvent
+from src.providers.openrouter import _SyncToAsyncQueueIterator
 
 
 @pytest.mark.asyncio
-async def test_mock_provider_yields_chunks_and_done():
-    provider = MockProvider(responses=["Hello", " world"])
-    events = []
-    async for event in await provider.run("sys", [], "hi"):
-        events.append(event)
-    
-    assert len(events) == 3
-    assert isinstance(events[0], TextChunkEvent)
-    assert events[0].content == "Hello"
-    assert isinstance(events[1], TextChunkEvent)
-    assert events[1].content == " world"
-    assert isinstance(events[2], DoneEvent)
+@pytest.mark.parametrize("responses", [["Hello", " world"], []], ids=["chunks", "empty"])
+async def test_mock_provider(responses):
+    """MockProvider yields one TextChunkEvent per response, then a single DoneEvent."""
+    provider = MockProvider(responses=responses)
+    events = [e async for e in await provider.run("sys", [], "hi")]
+
+    assert len(events) == len(responses) + 1
+    assert [e.content for e in events if type(e) is TextChunkEvent] == responses
+    assert type(events[-1]) is DoneEvent
+
+
+async def _drain_from_thread(produce, **kwargs):
+    """Feed a _SyncToAsyncQueueIterator from a worker thread and collect everything it yields."""
+    events = _SyncToAsyncQueueIterator(asyncio.get_running_loop(), **kwargs)
+    worker = asyncio.create_task(asyncio.to_thread(produce, events))
+    collected = [e async for e in events]
+    await worker
+    return collected
+
+
+@pytest.mark.asyncio
+async def test_queue_iterator_flushes_at_max_chars():
+    def produce(events):
+        events.schedule_text("a" * 200)
+        events.schedule_text("b" * 100)  # crosses 256 → flushed without waiting for the window
+        events.schedule_text("c")
+        events.close()
+
+    # A window far longer than the test — only the size limit and close() can flush
+    collected = await _drain_from_thread(produce, coalesce_window=60)
+
+    assert [e.content for e in collected] == ["a" * 200 + "b" * 100, "c"]
+
+
+@pytest.mark.asyncio
+async def test_queue_iterator_flushes_text_before_other_events():
+    def produce(events):
+        events.schedule_text("Hel")
+        events.schedule_text("lo")
+        events.schedule(DoneEvent())
+        events.close()
+
+    collected = await _drain_from_thread(produce, coalesce_window=60)
+
+    assert len(collected) == 2
+    assert type(collected[0]) is TextChunkEvent
+    assert collected[0].content == "Hello"
+    assert type(collected[1]) is DoneEvent
 
 
 @pytest.mark.asyncio
-async def test_mock_provider_empty_responses():
-    provider = MockProvider(responses=[])
-    events = []
-    async for event in await provider.run("sys", [], "hi"):
-        events.append(event)
-    
-    assert len(events) == 1
-    assert isinstance(events[0], DoneEvent)
+async def test_queue_iterator_sentinel_ends_iteration():
+    collected = await _drain_from_thread(lambda events: events.close())
+    assert collected == []
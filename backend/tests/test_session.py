@@ -1,18 +1,22 @@
 """Tests for Session and SessionStore."""
 
 import asyncio
+import os
+import shutil
+import uuid
 import pytest
 from pathlib import Path
-from datetime import datetime
 
-from src.core.models import AgentConfig, SessionState
-from src.core.session import Session, MemorySessionStore, FileSessionStore
+from src.config import Config
+from src.core.agent import Agent
+from src.core.events import TextChunkEvent, DoneEvent
+from src.core.models import AgentConfig, Message, SessionState
+from src.core.session import Session, MemorySessionStore, FileSessionStore, _new_session_id
 from src.core.provider import MockProvider
+from tests.helpers import NOW
 
 
 def make_agent(tmp_path, system_prompt="You are helpful."):
-    from src.core.agent import Agent
-    from src.core.models import AgentConfig
     config_obj = AgentConfig(
         id="test",
         name="Test",
@@ -20,7 +24,23 @@ def make_agent(tmp_path, system_prompt="You are helpful."):
         model="mock",
         system_prompt=system_prompt,
     )
-    return Agent(config=config_obj, memory_dir=tmp_path / "memory")
+    return Agent(config=config_obj, cfg=Config(base_dir=tmp_path))
+
+
+def make_state(**kwargs) -> SessionState:
+    """A fresh, known-valid SessionState for the store tests (no validation, own messages list)."""
+    defaults = dict(
+        id="tmpl",
+        title="Test",
+        agent_id="assistant",
+        provider_id="claude-cli",
+        model="claude-opus-4-5",
+        messages=[],
+        created_at=NOW,
+        updated_at=NOW,
+    )
+    defaults.update(kwargs)
+    return SessionState.model_construct(**defaults)
 
 
 @pytest.fixture
@@ -28,37 +48,64 @@ def memory_store():
     return MemorySessionStore()
 
 
-@pytest.mark.asyncio
-async def test_session_new_and_send(tmp_path):
-    """Session.new() + send() with MockProvider yields correct events."""
-    agent = make_agent(tmp_path)
-    store = MemorySessionStore()
-    
-    # Patch Session.new to use MockProvider instead of real provider
-    from src.core.models import SessionState
-    from src.core.session import _new_session_id
-    now = datetime.utcnow()
-    state = SessionState(
+@pytest.fixture
+def ram_tmp_path(tmp_path):
+    """Scratch dir on /dev/shm (tmpfs) when available, else tmp_path."""
+    if not (os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK)):
+        yield tmp_path
+        return
+    path = Path("/dev/shm") / f"yap-{uuid.uuid4().hex}"
+    path.mkdir()
+    try:
+        yield path
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.fixture
+def mock_provider_factory():
+    """Builder for MockProviders with canned responses."""
+    def _make(responses: list[str]) -> MockProvider:
+        return MockProvider(responses=responses)
+    return _make
+
+
+@pytest.fixture
+def fresh_state():
+    """A new, empty SessionState for the Session.send() tests."""
+    return SessionState.model_construct(
         id=_new_session_id(),
         title="New conversation",
         agent_id="test",
         provider_id="claude-cli",
         model="mock",
-        created_at=now,
-        updated_at=now,
+        created_at=NOW,
+        updated_at=NOW,
     )
-    store.save(state)
-    provider = MockProvider(responses=["Hello", " world"])
-    session = Session(state=state, agent=agent, provider=provider, store=store)
 
-    events = []
-    async for event in await session.send("Hi"):
-        events.append(event)
 
-    from src.core.events import TextChunkEvent, DoneEvent
-    text_events = [e for e in events if isinstance(e, TextChunkEvent)]
-    done_events = [e for e in events if isinstance(e, DoneEvent)]
-    
+@pytest.fixture
+def session_fixture(tmp_path, fresh_state, mock_provider_factory):
+    """Factory: (Session over fresh_state whose MockProvider returns `responses`, its store)."""
+    agent = make_agent(tmp_path)
+    store = MemorySessionStore()
+    store.save(fresh_state)
+
+    def _make(responses: list[str]) -> tuple[Session, MemorySessionStore]:
+        provider = mock_provider_factory(responses)
+        return Session(state=fresh_state, agent=agent, provider=provider, store=store), store
+    return _make
+
+
+def _check_events(session, events):
+    """send() with MockProvider yields the text chunks, then a single DoneEvent."""
+    text_events, done_events = [], []
+    for e in events:
+        if type(e) is TextChunkEvent:
+            text_events.append(e)
+        elif type(e) is DoneEvent:
+            done_events.append(e)
+
     assert len(text_events) == 2
     assert text_events[0].content == "Hello"
     assert text_events[1].content == " world"
@@ -66,31 +113,8 @@ async def test_session_new_and_send(tmp_path):
     assert events[-1] == done_events[0]
 
 
-@pytest.mark.asyncio
-async def test_session_appends_messages(tmp_path):
+def _check_messages(session, events):
     """After send(), session has user + assistant messages."""
-    agent = make_agent(tmp_path)
-    store = MemorySessionStore()
-    
-    from src.core.models import SessionState
-    from src.core.session import _new_session_id
-    now = datetime.utcnow()
-    state = SessionState(
-        id=_new_session_id(),
-        title="New conversation",
-        agent_id="test",
-        provider_id="claude-cli",
-        model="mock",
-        created_at=now,
-        updated_at=now,
-    )
-    store.save(state)
-    provider = MockProvider(responses=["Response text"])
-    session = Session(state=state, agent=agent, provider=provider, store=store)
-
-    async for _ in await session.send("User message"):
-        pass
-
     assert len(session.messages) == 2
     assert session.messages[0].role == "user"
     assert session.messages[0].content == "User message"
@@ -98,46 +122,46 @@ async def test_session_appends_messages(tmp_path):
     assert session.messages[1].content == "Response text"
 
 
-@pytest.mark.asyncio
-async def test_session_auto_title(tmp_path):
+def _check_title(session, events):
     """First user message auto-sets the session title."""
-    agent = make_agent(tmp_path)
-    store = MemorySessionStore()
+    assert session.state.title == "What is the weather?"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("responses,user,check", [
+    pytest.param(["Hello", " world"], "Hi", _check_events, id="new_and_send"),
+    pytest.param(["Response text"], "User message", _check_messages, id="appends_messages"),
+    pytest.param(["ok"], "What is the weather?", _check_title, id="auto_title"),
+])
+async def test_session_behaviors(session_fixture, responses, user, check):
+    session, _ = session_fixture(responses)
+    events = [e async for e in await session.send(user)]
+    check(session, events)
 
-    from src.core.models import SessionState
-    from src.core.session import _new_session_id
-    now = datetime.utcnow()
-    state = SessionState(
-        id=_new_session_id(),
-        title="New conversation",
-        agent_id="test",
-        provider_id="claude-cli",
-        model="mock",
-        created_at=now,
-        updated_at=now,
-    )
-    store.save(state)
-    provider = MockProvider(responses=["ok"])
-    session = Session(state=state, agent=agent, provider=provider, store=store)
 
-    async for _ in await session.send("What is the weather?"):
+@pytest.mark.asyncio
+async def test_session_send_minimizes_saves(session_fixture, monkeypatch):
+    """send() persists once per turn, not once per streamed chunk."""
+    session, store = session_fixture([f"chunk{i} " for i in range(20)])
+    saves = 0
+    orig = store.save
+
+    def counting_save(state):
+        nonlocal saves
+        saves += 1
+        orig(state)
+
+    monkeypatch.setattr(store, "save", counting_save)
+    async for _ in await session.send("hi"):
         pass
 
-    assert session.state.title == "What is the weather?"
+    assert saves <= 2
+    assert store.load(session.id).messages[-1].content.startswith("chunk0 ")
 
 
 def test_memory_store_save_load():
     store = MemorySessionStore()
-    now = datetime.utcnow()
-    state = SessionState(
-        id="s1",
-        title="Test",
-        agent_id="assistant",
-        provider_id="claude-cli",
-        model="claude-opus-4-5",
-        created_at=now,
-        updated_at=now,
-    )
+    state = make_state(id="s1")
     store.save(state)
     loaded = store.load("s1")
     assert loaded.id == "s1"
@@ -152,33 +176,14 @@ def test_memory_store_not_found():
 
 def test_memory_store_list():
     store = MemorySessionStore()
-    now = datetime.utcnow()
     for i in range(3):
-        state = SessionState(
-            id=f"s{i}",
-            title=f"Session {i}",
-            agent_id="assistant",
-            provider_id="claude-cli",
-            model="claude-opus-4-5",
-            created_at=now,
-            updated_at=now,
-        )
-        store.save(state)
+        store.save(make_state(id=f"s{i}", title=f"Session {i}"))
     assert len(store.list()) == 3
 
 
 def test_memory_store_archive_restore():
     store = MemorySessionStore()
-    now = datetime.utcnow()
-    state = SessionState(
-        id="s1",
-        title="Test",
-        agent_id="assistant",
-        provider_id="claude-cli",
-        model="claude-opus-4-5",
-        created_at=now,
-        updated_at=now,
-    )
+    state = make_state(id="s1")
     store.save(state)
     store.archive("s1")
     assert store.load("s1").archived is True
@@ -186,29 +191,27 @@ def test_memory_store_archive_restore():
     assert store.load("s1").archived is False
 
 
-def test_file_store_roundtrip(tmp_path):
-    store = FileSessionStore(chats_dir=tmp_path / "chats")
-    now = datetime.utcnow()
+def test_file_store_roundtrip(ram_tmp_path):
+    store = FileSessionStore(chats_dir=ram_tmp_path / "chats")
     state = SessionState(
         id="s1",
         title="File Test",
         agent_id="assistant",
         provider_id="claude-cli",
         model="claude-opus-4-5",
-        created_at=now,
-        updated_at=now,
+        created_at=NOW,
+        updated_at=NOW,
     )
     store.save(state)
     loaded = store.load("s1")
     assert loaded.id == "s1"
     assert loaded.title == "File Test"
-    # Verify file exists
-    assert (tmp_path / "chats" / "s1.json").exists()
+    # Verify file exists (plain os.path calls — no intermediate Path objects)
+    assert os.path.exists(os.path.join(ram_tmp_path, "chats", "s1.json"))
 
 
-def test_file_store_list(tmp_path):
-    store = FileSessionStore(chats_dir=tmp_path / "chats")
-    now = datetime.utcnow()
+def test_file_store_list(ram_tmp_path):
+    store = FileSessionStore(chats_dir=ram_tmp_path / "chats")
     for i in range(2):
         state = SessionState(
             id=f"s{i}",
@@ -216,8 +219,82 @@ def test_file_store_list(tmp_path):
             agent_id="assistant",
             provider_id="claude-cli",
             model="claude-opus-4-5",
-            created_at=now,
-            updated_at=now,
+            created_at=NOW,
+            updated_at=NOW,
         )
         store.save(state)
     assert len(store.list()) == 2
+
+
+def test_file_store_durability(ram_tmp_path):
+    """save() replaces the file atomically — no temp file left, overwrite is complete."""
+    store = FileSessionStore(chats_dir=ram_tmp_path / "chats")
+    store.save(make_state(id="s1", title="x" * 1000))
+    store.save(make_state(id="s1", title="short"))
+
+    assert os.listdir(os.path.join(ram_tmp_path, "chats")) == ["s1.json"]
+    assert store.load("s1").title == "short"
+
+
+def test_file_store_list_caches(ram_tmp_path, monkeypatch):
+    """list() only re-parses files changed behind its back, and hands out copies."""
+    writer = FileSessionStore(chats_dir=ram_tmp_path / "chats")
+    for i in range(100):
+        writer.save(make_state(id=f"s{i}"))
+    store = FileSessionStore(chats_dir=ram_tmp_path / "chats")
+
+    reads = 0
+    orig = Path.read_text
+
+    def counting_read_text(self, *args, **kwargs):
+        nonlocal reads
+        reads += 1
+        return orig(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+    assert len(store.list()) == 100
+    assert reads == 100
+    assert len(store.list()) == 100
+    assert reads == 100
+
+    # Written by another store instance — picked up from disk
+    writer.save(make_state(id="s0", title="Renamed"))
+    assert {s.id: s.title for s in store.list()}["s0"] == "Renamed"
+    assert reads == 101
+
+    # Written through this store — cache updated without a re-read
+    store.save(make_state(id="s1", title="Mine"))
+    listed = {s.id: s for s in store.list()}
+    assert listed["s1"].title == "Mine"
+    assert reads == 101
+
+    # Mutating a listed state doesn't leak into later list() calls
+    listed["s2"].alias = "X"
+    listed["s2"].messages.append(Message(role="user", content="unsaved", timestamp=NOW))
+    again = {s.id: s for s in store.list()}["s2"]
+    assert again.alias is None
+    assert again.messages == []
+
+    store.delete("s3")
+    assert len(store.list()) == 99
+
+
+def test_file_store_list_caches_many_sessions(ram_tmp_path, monkeypatch):
+    """Hundreds of sessions still hit the cache on the second list()."""
+    writer = FileSessionStore(chats_dir=ram_tmp_path / "chats")
+    for i in range(300):
+        writer.save(make_state(id=f"s{i}"))
+    store = FileSessionStore(chats_dir=ram_tmp_path / "chats")
+
+    reads = 0
+    orig = Path.read_text
+
+    def counting_read_text(self, *args, **kwargs):
+        nonlocal reads
+        reads += 1
+        return orig(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+    assert len(store.list()) == 300
+    assert len(store.list()) == 300
+    assert reads == 300